@@ -90,6 +90,16 @@ def test_aggregate_format_kwargs():
     ) == ["min('2012-01-01' - date)"]
 
 
+def test_aggregation_selects_cached():
+    agg = Aggregation([Aggregate("x", "sum", {})], from_obj='source',
+                      groups=['entity_id'], state_table='tbl')
+    selects = agg.get_selects()
+    (query,) = selects['entity_id']
+    selects['entity_id'].append(query.limit(0))
+    (cached,) = agg.get_selects()['entity_id']
+    assert cached is query
+
+
 def test_aggregation_table_name_no_schema():
     # no schema
     assert Aggregation([], from_obj='source', groups=[], state_table='tbl')\
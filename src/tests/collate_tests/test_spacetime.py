@@ -246,3 +246,41 @@ def test_input_min_date():
             st.validate(engine.connect())
         with pytest.raises(ValueError):
             st.execute(engine.connect())
+
+
+def test_where_sql():
+    st = SpacetimeAggregation(
+        aggregates=[Aggregate('outcome::int', 'sum', {})],
+        from_obj='events',
+        groups=['entity_id'],
+        intervals=['1y', '2y'],
+        dates=['2016-01-01 06:00:00', '2015-01-01'],
+        state_table='states',
+        date_column='event_date',
+        output_date_column='as_of_date',
+        input_min_date='2000-01-01'
+    )
+
+    # the upper bound keeps the time of day, the interval bounds count from the date
+    assert str(st.where('2016-01-01 06:00:00', ['1y', '2y'])) == (
+        "event_date < '2016-01-01 06:00:00'"
+        " AND event_date >= '2016-01-01 06:00:00'::date"
+        " - greatest(interval '1y',interval '2y')"
+        " AND event_date >= '2000-01-01'::date"
+    )
+    assert str(st.where('2016-01-01', ['1y', 'all'])) == (
+        "event_date < '2016-01-01' AND event_date >= '2000-01-01'::date"
+    )
+
+    assert st.get_join_table() == (
+        "SELECT entity_id, collate_dates.collate_date AS as_of_date \n"
+        "FROM events, (VALUES "
+        "('2016-01-01 06:00:00'::date, '2016-01-01 06:00:00'::timestamp),"
+        "('2015-01-01'::date, '2015-01-01'::timestamp)"
+        ") AS collate_dates(collate_date, collate_cutoff) \n"
+        "WHERE event_date < collate_dates.collate_cutoff"
+        " AND event_date >= collate_dates.collate_date"
+        " - greatest(interval '1y',interval '2y')"
+        " AND event_date >= '2000-01-01'::date"
+        " GROUP BY entity_id, collate_dates.collate_date"
+    )
@@ -310,6 +310,30 @@ def test_build_error(experiment_class):
                     experiment()
 
 
+@mock.patch('triage.component.architect.feature_generators.'
+            'FeatureGenerator.process_table_tasks',
+            side_effect=ValueError('boom!'))
+def test_multicore_imputation_error(_process_table_tasks_mock):
+    with testing.postgresql.Postgresql() as postgresql:
+        db_engine = create_engine(postgresql.url())
+        ensure_db(db_engine)
+        populate_source_data(db_engine)
+
+        with TemporaryDirectory() as temp_dir:
+            experiment = MultiCoreExperiment(
+                config=sample_config(),
+                db_engine=db_engine,
+                model_storage_class=FSModelStorageEngine,
+                project_path=os.path.join(temp_dir, 'inspections'),
+                n_processes=2,
+                n_db_processes=2,
+            )
+
+            # the imputation tasks fail in the worker processes
+            with pytest.raises(RuntimeError):
+                experiment.build_matrices()
+
+
 @parametrize_experiment_classes
 @mock.patch('triage.component.architect.state_table_generators.'
             'StateTableGenerator.clean_up',
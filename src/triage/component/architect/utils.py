@@ -1,5 +1,4 @@
-import functools
-import operator
+import itertools
 
 
 def feature_list(feature_dictionary):
@@ -10,12 +9,7 @@ def feature_list(feature_dictionary):
     Returns: sorted list of feature names
 
     """
-    return sorted(
-        functools.reduce(
-            operator.concat,
-            (feature_dictionary[key] for key in feature_dictionary.keys())
-        )
-    )
+    return sorted(itertools.chain.from_iterable(feature_dictionary.values()))
 
 
 def str_in_sql(values):
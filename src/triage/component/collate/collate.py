@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from numbers import Number
-from itertools import product, chain
+from itertools import product
 import sqlalchemy.sql.expression as ex
 import re
 
@@ -172,6 +172,26 @@ class Aggregate(AggregateExpression):
         self.orders = make_list(order)
         self.impute_rules = impute_rules
 
+        # everything but the filter, prefix and format_kwargs is fixed at
+        # construction, so expand the function x quantity x order product once
+        self._column_specs = []
+        ordered = self.orders != [None]
+        for function, (quantity_name, quantity), order in product(
+                self.functions, self.quantities.items(), self.orders):
+            distinct, quantity = split_distinct(quantity)
+            args = str.join(", ", map(str, quantity))
+            order_clause = " WITHIN GROUP (ORDER BY %s)" % order if ordered else ""
+
+            if order is not None:
+                if len(quantity_name) > 0:
+                    quantity_name += '_'
+                quantity_name += to_sql_name(order)
+
+            self._column_specs.append((
+                "%s(%s%s)%s" % (function, distinct, args, order_clause),
+                to_sql_name("%s_%s" % (quantity_name, function)),
+            ))
+
     def get_columns(self, when=None, prefix=None, format_kwargs=None):
         """
         Args:
@@ -180,45 +200,23 @@ class Aggregate(AggregateExpression):
             prefix: prefix for column names
             format_kwargs: kwargs to pass to format the aggregate quantity
         Returns:
-            collection of SQLAlchemy columns
+            list of SQLAlchemy columns
         """
         if prefix is None:
             prefix = ""
         if format_kwargs is None:
             format_kwargs = {}
 
-        name_template = "{prefix}{quantity_name}_{function}"
-        column_template = "{function}({distinct}{args}){order_clause}{filter}"
-        arg_template = "{quantity}"
-        order_template = ""
-        filter_template = ""
+        filter = " FILTER (WHERE %s)" % when if when else ""
+        # column names are stored with quotes already stripped
+        prefix = to_sql_name(prefix)
 
-        if self.orders != [None]:
-            order_template += " WITHIN GROUP (ORDER BY {order})"
-        if when:
-            filter_template = " FILTER (WHERE {when})"
+        columns = []
+        for column, name in self._column_specs:
+            column = (column + filter).format(**format_kwargs)
+            columns.append(ex.literal_column(column).label(prefix + name))
 
-        for function, (quantity_name, quantity), order in product(
-                self.functions, self.quantities.items(), self.orders):
-            distinct, quantity = split_distinct(quantity)
-            args = str.join(", ", (arg_template.format(quantity=q)
-                                   for q in quantity))
-            order_clause = order_template.format(order=order)
-            filter = filter_template.format(when=when)
-
-            if order is not None:
-                if len(quantity_name) > 0:
-                    quantity_name += '_'
-                quantity_name += to_sql_name(order)
-
-            kwargs = dict(function=function, args=args, prefix=prefix,
-                          distinct=distinct, order_clause=order_clause,
-                          quantity_name=quantity_name, filter=filter, **format_kwargs)
-
-            column = column_template.format(**kwargs).format(**format_kwargs)
-            name = name_template.format(**kwargs)
-
-            yield ex.literal_column(column).label(to_sql_name(name))
+        return columns
 
     def column_imputation_lookup(self, prefix=None):
         """
@@ -387,42 +385,58 @@ class Aggregation(object):
         self.aggregates = aggregates
         self.from_obj = make_sql_clause(from_obj, ex.text)
         self.groups = groups if isinstance(groups, dict) else {str(g): g for g in groups}
+        self._gb_clauses = {group: make_sql_clause(groupby, ex.literal_column)
+                            for group, groupby in self.groups.items()}
         self.state_table = state_table
         self.state_group = state_group if state_group else "entity_id"
         self.prefix = prefix if prefix else str(from_obj)
         self.suffix = suffix if suffix else "aggregation"
         self.schema = schema
+        # table names by (group, imputed), see get_table_name
+        self._table_names = {}
+        # select queries by group, see get_selects
+        self._selects = None
 
     def _get_aggregates_sql(self, group):
         """
         Helper for getting aggregates sql
         Args:
             group: group clause, for naming columns
-        Returns: collection of aggregate column SQL strings
+        Returns: list of aggregate column SQL strings
         """
         prefix = "{prefix}_{group}_".format(
                 prefix=self.prefix, group=group)
 
-        return chain(*[a.get_columns(prefix=prefix)
-                       for a in self.aggregates])
+        return [column for a in self.aggregates
+                for column in a.get_columns(prefix=prefix)]
 
     def get_selects(self):
         """
         Constructs select queries for this aggregation
 
+        The queries are built once and shared by get_creates, get_inserts
+        and any later calls.
+
         Returns: a dictionary of group : queries pairs where
             group are the same keys as groups
             queries is a list of Select queries, one for each date in dates
         """
+        if self._selects is None:
+            self._selects = self._get_selects()
+        return {group: list(queries) for group, queries in self._selects.items()}
+
+    def _get_selects(self):
+        """
+        Helper for building the select queries returned by get_selects
+        """
         queries = {}
 
         for group, groupby in self.groups.items():
             columns = [groupby]
             columns += self._get_aggregates_sql(group)
 
-            gb_clause = make_sql_clause(groupby, ex.literal_column)
             query = ex.select(columns=columns, from_obj=self.from_obj)\
-                      .group_by(gb_clause)
+                      .group_by(self._gb_clauses[group])
 
             queries[group] = [query]
 
@@ -447,6 +461,11 @@ class Aggregation(object):
         """
         Returns name for table for the given group
         """
+        try:
+            return self._table_names[group, imputed]
+        except KeyError:
+            pass
+
         if group is None and not imputed:
             name = '"%s_%s"' % (self.prefix, self.suffix)
         elif group is None and imputed:
@@ -456,7 +475,8 @@ class Aggregation(object):
         else:
             name = '"%s"' % to_sql_name("%s_%s" % (self.prefix, group))
         schema = '"%s".' % self.schema if self.schema else ''
-        return "%s%s" % (schema, name)
+        self._table_names[group, imputed] = "%s%s" % (schema, name)
+        return self._table_names[group, imputed]
 
     def get_creates(self):
         """
@@ -530,12 +550,11 @@ class Aggregation(object):
         if not join_table:
             join_table = '(%s) t1' % self.get_join_table()
 
-        query = "SELECT * FROM %s\n" % join_table
-        for group, groupby in self.groups.items():
-            query += "LEFT JOIN %s USING (%s)" % (
-                    self.get_table_name(group), groupby)
+        query = ["SELECT * FROM %s" % join_table]
+        query.extend("LEFT JOIN %s USING (%s)" % (self.get_table_name(group), groupby)
+                     for group, groupby in self.groups.items())
 
-        return "CREATE TABLE %s AS (%s);" % (self.get_table_name(), query)
+        return "CREATE TABLE %s AS (%s);" % (self.get_table_name(), str.join("\n", query))
 
     def get_drop(self, imputed=False):
         """
@@ -584,14 +603,13 @@ class Aggregation(object):
         if len(missing_cols) > 0:
             raise ValueError('Missing columns in get_impute_create: %s' % missing_cols)
 
-        # key columns and date column
-        query = ""
+        columns = []
 
         # pre-sort and iterate through the combined set to ensure column order
         for col in sorted(nonimpute_cols + impute_cols):
             # just pass through columns that don't require imputation (no nulls found)
             if col in nonimpute_cols:
-                query += '\n,"%s"' % col
+                columns.append('"%s"' % col)
 
             # for columns that do require imputation, include SQL to do the imputation work
             # and a flag for whether the value was imputed
@@ -610,13 +628,13 @@ class Aggregation(object):
 
                 imputer = imputer(column=col, partitionby=partitionby, **impute_rule)
 
-                query += '\n,%s' % imputer.to_sql()
+                columns.append(imputer.to_sql())
                 if not imputer.noflag:
                     # Add an imputation flag for non-categorical columns (this is handeled
                     # for categorical columns with a separate NULL category)
-                    query += '\n,%s' % imputer.imputed_flag_sql()
+                    columns.append(imputer.imputed_flag_sql())
 
-        return query
+        return str.join("", ("\n,%s" % column for column in columns))
 
     def get_impute_create(self, impute_cols, nonimpute_cols):
         """
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
-from itertools import chain
 import sqlalchemy.sql.expression as ex
 
-from .sql import make_sql_clause
 from .collate import Aggregation
 
 
@@ -43,10 +41,19 @@ class SpacetimeAggregation(Aggregation):
             self.intervals = intervals
         else:
             self.intervals = {g: intervals for g in self.groups}
+        # (interval, column name prefix) pairs for each group, see _get_prefix
+        self._interval_prefixes = {
+            group: [(interval, self._get_prefix(group, interval)) for interval in intervals]
+            for group, intervals in self.intervals.items()
+        }
         self.dates = dates
         self.date_column = date_column if date_column else "date"
         self.output_date_column = output_date_column if output_date_column else "date"
         self.input_min_date = input_min_date
+        self._date_columns = {
+            date: ex.literal_column("'%s'::date" % date).label(self.output_date_column)
+            for date in self.dates
+        }
 
     def _state_table_sub(self):
         """Helper function to ensure we only include state table records
@@ -67,14 +74,22 @@ class SpacetimeAggregation(Aggregation):
             mindtstr=mindtstr
         )
 
-    def _get_aggregates_sql(self, interval, date, group):
+    def _get_prefix(self, group, interval):
+        """
+        Helper for getting the column name prefix of a group and interval
+        """
+        return "{prefix}_{group}_{interval}_".format(
+                prefix=self.prefix, interval=interval,
+                group=group)
+
+    def _get_aggregates_sql(self, interval, date, prefix):
         """
         Helper for getting aggregates sql
         Args:
             interval: SQL time interval string, or "all"
             date: SQL date string
-            group: group clause, for naming columns
-        Returns: collection of aggregate column SQL strings
+            prefix: prefix for column names, see _get_prefix
+        Returns: list of aggregate column SQL strings
         """
         if interval != 'all':
             when = "{date_column} >= '{date}'::date - interval '{interval}'".format(
@@ -82,21 +97,15 @@ class SpacetimeAggregation(Aggregation):
         else:
             when = None
 
-        prefix = "{prefix}_{group}_{interval}_".format(
-                prefix=self.prefix, interval=interval,
-                group=group)
+        format_kwargs = {"collate_date": date, "collate_interval": interval}
 
-        return chain(*[a.get_columns(when, prefix, format_kwargs={"collate_date": date,
-                                                                  "collate_interval": interval})
-                       for a in self.aggregates])
+        return [column for a in self.aggregates
+                for column in a.get_columns(when, prefix, format_kwargs=format_kwargs)]
 
-    def get_selects(self):
+    def _get_selects(self):
         """
-        Constructs select queries for this aggregation
-
-        Returns: a dictionary of group : queries pairs where
-            group are the same keys as groups
-            queries is a list of Select queries, one for each date in dates
+        Helper for building the select queries returned by get_selects,
+            one for each date in dates
         """
         queries = {}
 
@@ -104,15 +113,12 @@ class SpacetimeAggregation(Aggregation):
             intervals = self.intervals[group]
             queries[group] = []
             for date in self.dates:
-                columns = [groupby,
-                           ex.literal_column("'%s'::date"
-                                             % date).label(self.output_date_column)]
-                columns += list(chain(*[self._get_aggregates_sql(
-                        i, date, group) for i in intervals]))
+                columns = [groupby, self._date_columns[date]]
+                for i, prefix in self._interval_prefixes[group]:
+                    columns += self._get_aggregates_sql(i, date, prefix)
 
-                gb_clause = make_sql_clause(groupby, ex.literal_column)
                 query = ex.select(columns=columns, from_obj=self.from_obj)\
-                          .group_by(gb_clause)
+                          .group_by(self._gb_clauses[group])
                 query = query.where(self.where(date, intervals))
 
                 queries[group].append(query)
@@ -128,10 +134,7 @@ class SpacetimeAggregation(Aggregation):
         """
         imprules = {}
         for group, groupby in self.groups.items():
-            for interval in self.intervals[group]:
-                prefix = "{prefix}_{group}_{interval}_".format(
-                        prefix=self.prefix, interval=interval,
-                        group=group)
+            for _, prefix in self._interval_prefixes[group]:
                 for a in self.aggregates:
                     imprules.update(a.column_imputation_lookup(prefix=prefix))
         return imprules
@@ -146,21 +149,34 @@ class SpacetimeAggregation(Aggregation):
         Returns: a clause for filtering the from_obj to be between the date and
             the greatest interval
         """
+        return ex.text(self._where_sql("'%s'" % date, "'%s'::date" % date, intervals))
+
+    def _where_sql(self, end, start, intervals):
+        """
+        Helper for the WHERE clause SQL
+        Args:
+            end: SQL expression for the (exclusive) upper bound, e.g. an
+                uncast date literal or a column of cutoffs being joined against
+            start: SQL date expression the intervals are subtracted from
+            intervals: intervals
+
+        Returns: SQL string for the WHERE clause
+        """
         # upper bound
-        w = "{date_column} < '{date}'".format(
-                            date_column=self.date_column, date=date)
+        w = "{date_column} < {end}".format(
+                            date_column=self.date_column, end=end)
 
         # lower bound (if possible)
         if 'all' not in intervals:
             greatest = "greatest(%s)" % str.join(
                     ",", ["interval '%s'" % i for i in intervals])
-            min_date = "'{date}'::date - {greatest}".format(date=date, greatest=greatest)
-            w += "AND {date_column} >= {min_date}".format(
+            min_date = "{start} - {greatest}".format(start=start, greatest=greatest)
+            w += " AND {date_column} >= {min_date}".format(
                     date_column=self.date_column, min_date=min_date)
         if self.input_min_date is not None:
-            w += "AND {date_column} >= '{bot}'::date".format(
+            w += " AND {date_column} >= '{bot}'::date".format(
                     date_column=self.date_column, bot=self.input_min_date)
-        return ex.text(w)
+        return w
 
     def get_indexes(self):
         """
@@ -180,17 +196,24 @@ class SpacetimeAggregation(Aggregation):
         groups and dates in the from_obj
         """
         groups = list(self.groups.values())
-        intervals = list(set(chain(*self.intervals.values())))
+        intervals = sorted({i for intervals in self.intervals.values() for i in intervals})
 
-        queries = []
-        for date in self.dates:
-            columns = groups + [ex.literal_column("'%s'::date" % date).label(
-                    self.output_date_column)]
-            queries.append(ex.select(columns, from_obj=self.from_obj)
-                             .where(self.where(date, intervals))
-                             .group_by(*groups))
+        # join every row against the list of dates in a single scan of the
+        # from_obj, rather than a UNION ALL of one scan per date. the cutoff
+        # keeps any time of day in the date, as the per-date selects do
+        dates = ex.text(
+            "(VALUES %s) AS collate_dates(collate_date, collate_cutoff)" %
+            str.join(",", ["('%s'::date, '%s'::timestamp)" % (date, date)
+                           for date in self.dates]))
+        date = ex.literal_column("collate_dates.collate_date")
+        where = self._where_sql("collate_dates.collate_cutoff", str(date), intervals)
 
-        return str.join("\nUNION ALL\n", map(str, queries))
+        columns = groups + [date.label(self.output_date_column)]
+        query = ex.select(columns, from_obj=[self.from_obj, dates])\
+                  .where(ex.text(where))\
+                  .group_by(*(groups + [date]))
+
+        return str(query)
 
     def get_create(self, join_table=None):
         """
@@ -200,12 +223,12 @@ class SpacetimeAggregation(Aggregation):
         """
         if not join_table:
             join_table = '(%s) t1' % self.get_join_table()
-        query = "SELECT * FROM %s\n" % join_table
-        for group, groupby in self.groups.items():
-            query += " LEFT JOIN %s USING (%s, %s)" % (
-                    self.get_table_name(group), groupby, self.output_date_column)
+        query = ["SELECT * FROM %s" % join_table]
+        query.extend("LEFT JOIN %s USING (%s, %s)" % (
+                        self.get_table_name(group), groupby, self.output_date_column)
+                     for group, groupby in self.groups.items())
 
-        return "CREATE TABLE %s AS (%s);" % (self.get_table_name(), query)
+        return "CREATE TABLE %s AS (%s);" % (self.get_table_name(), str.join("\n", query))
 
     def validate(self, conn):
         """
@@ -134,6 +134,7 @@ class MultiCoreExperiment(ExperimentBase):
             num_successes,
             num_failures
         )
+        return num_failures
 
     def build_matrices(self):
         logging.info('Creating sparse states')
@@ -161,8 +162,25 @@ class MultiCoreExperiment(ExperimentBase):
             self.feature_generator.run_commands(tasks.get('finalize', []))
             logging.info('%s completed', table_name)
 
-        logging.info('Creating feature imputation tables')
-        self.feature_generator.process_table_tasks(self.feature_imputation_table_tasks)
+        logging.info(
+            'Creating feature imputation tables with %s processes',
+            self.n_db_processes
+        )
+        partial_process_table_tasks = partial(
+            process_table_tasks,
+            feature_generator_factory=self.feature_generator_factory,
+            db_connection_string=self.db_engine.url
+        )
+        num_failures = self.parallelize_with_success_count(
+            partial_process_table_tasks,
+            list(self.feature_imputation_table_tasks.items()),
+            n_processes=self.n_db_processes
+        )
+        if num_failures > 0:
+            # matrices can't be built from missing or partial imputation tables
+            raise RuntimeError(
+                'Failed to create %s feature imputation tables' % num_failures
+            )
 
         partial_build_matrix = partial(
             build_matrix,
@@ -211,6 +229,21 @@ def insert_into_table(
         return False
 
 
+def process_table_tasks(
+    table_tasks,
+    feature_generator_factory,
+    db_connection_string
+):
+    try:
+        db_engine = create_engine(db_connection_string)
+        feature_generator = feature_generator_factory(db_engine)
+        feature_generator.process_table_tasks(dict(table_tasks))
+        return True
+    except Exception:
+        logging.error('Child error: %s', traceback.format_exc())
+        return False
+
+
 def build_matrix(
     build_tasks,
     planner_factory,